@@ -13,8 +13,27 @@ logging.basicConfig(
     ]
 )
 
+ASSET_TEMPLATE = (
+    "  • Token: `{token}`\n"
+    "    • Units: `{units:,.4f}`\n"
+    "    • Available: `{available:,.4f}`\n"
+    "    • Price: `${price:.2f}`\n"
+    "    • Value: `${value:,.2f}`"
+)
+
+
+def log_send_result(task):
+    if task.cancelled():
+        return
+    if task.exception() is not None:
+        logging.error(task.exception())
+    else:
+        logging.info("message sent successfully")
+
 
 async def periodic_portfolio_update_task(hbot_client: HummingbotAPIClient, bot: Bot, chat_id: str, interval: int):
+    last_message = None
+    pending_send = None
     while True:
         try:
             portfolio_state = await hbot_client.portfolio.get_state()
@@ -25,27 +44,38 @@ async def periodic_portfolio_update_task(hbot_client: HummingbotAPIClient, bot:
 
             for exchange, assets in master_account.items():
                 lines.append(f"\n🔁 Exchange: *{exchange}*")
-                for asset in assets:
-                    token = asset.get("token")
-                    units = asset.get("units", 0)
-                    available = asset.get("available_units", 0)
-                    value = asset.get("value", 0)
-                    price = asset.get("price", 0)
-
-                    lines.append(
-                        f"  • Token: `{token}`\n"
-                        f"    • Units: `{units:,.4f}`\n"
-                        f"    • Available: `{available:,.4f}`\n"
-                        f"    • Price: `${price:.2f}`\n"
-                        f"    • Value: `${value:,.2f}`"
+                lines.extend(
+                    ASSET_TEMPLATE.format(
+                        token=asset.get("token"),
+                        units=asset.get("units", 0),
+                        available=asset.get("available_units", 0),
+                        price=asset.get("price", 0),
+                        value=asset.get("value", 0),
                     )
+                    for asset in assets
+                )
 
             message = "\n".join(lines)
-            await bot.send_message(chat_id=chat_id, text=message)
-            await asyncio.sleep(interval)
-            logging.info("message sent successfully")
+            # Forget the last message if sending it failed, so it is retried on this tick
+            if pending_send is not None and pending_send.done():
+                if pending_send.cancelled() or pending_send.exception() is not None:
+                    last_message = None
+                pending_send = None
+            # Only notify when the portfolio actually changed since the last update
+            if message != last_message:
+                # Send in the background so the Telegram round trip overlaps with the next
+                # interval, but keep messages ordered by letting the previous send finish first
+                if pending_send is not None:
+                    await asyncio.wait({pending_send})
+                pending_send = asyncio.create_task(bot.send_message(chat_id=chat_id, text=message))
+                pending_send.add_done_callback(log_send_result)
+                last_message = message
+            else:
+                logging.info("portfolio unchanged, skipping message")
         except Exception as e:
             logging.error(e)
+        finally:
+            await asyncio.sleep(interval)
 
 
 async def main():
@@ -63,4 +93,10 @@ async def main():
 
 if __name__ == '__main__':
     import asyncio
-    asyncio.run(main())
\ No newline at end of file
+
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
\ No newline at end of file
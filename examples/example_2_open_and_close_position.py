@@ -14,20 +14,25 @@ logging.basicConfig(
 
 
 async def open_and_close_a_position(hbot_client: HummingbotAPIClient, interval: int):
-    # 1: Set position mode HEDGE
-    await hbot_client.trading.set_position_mode(account_name="master_account", connector_name="binance_perpetual",
-                                                position_mode="HEDGE")
-    await asyncio.sleep(0.5)
+    # 1-3: Set position mode HEDGE, set leverage to 75x and fetch the price, these are independent requests
+    _, _, price = await asyncio.gather(
+        hbot_client.trading.set_position_mode(account_name="master_account", connector_name="binance_perpetual",
+                                              position_mode="HEDGE"),
+        hbot_client.trading.set_leverage(account_name="master_account", connector_name="binance_perpetual",
+                                         trading_pair="ERA-USDT", leverage=75),
+        hbot_client.market_data.get_prices(connector_name="binance_perpetual", trading_pairs="ERA-USDT"),
+    )
 
-    # 2: Set leverage to 75x
-    await hbot_client.trading.set_leverage(account_name="master_account", connector_name="binance_perpetual",
-                                           trading_pair="ERA-USDT", leverage=75)
-    await asyncio.sleep(0.5)
+    # Convert 100 USDT to ERA
+    amount_in_era = 100 / price["prices"]["ERA-USDT"]
 
+    # Legs are scheduled on a fixed timeline, one every `interval` seconds from the first order, so order
+    # round trips are absorbed into the waits instead of being added on top of them
+    loop = asyncio.get_running_loop()
+    start = loop.time()
 
-    # 3: Convert 100 USDT to ERA
-    price = await hbot_client.market_data.get_prices(connector_name="binance_perpetual", trading_pairs="ERA-USDT")
-    amount_in_era = 100 / price["prices"]["ERA-USDT"]
+    async def wait_for_leg(leg: int):
+        await asyncio.sleep(max(0.0, start + leg * interval - loop.time()))
 
     # 4: Open a long position on ERA-USDT on Binance perpetual with 100 USDT
     await hbot_client.trading.place_order(
@@ -39,7 +44,7 @@ async def open_and_close_a_position(hbot_client: HummingbotAPIClient, interval:
         amount=amount_in_era,
         position_action="OPEN",
     )
-    await asyncio.sleep(interval)
+    await wait_for_leg(1)
     # 5: Open a short position on ERA-USDT on Binance perpetual with 100 USDT
     await hbot_client.trading.place_order(
         account_name="master_account",
@@ -50,7 +55,7 @@ async def open_and_close_a_position(hbot_client: HummingbotAPIClient, interval:
         amount=amount_in_era,
         position_action="OPEN",
     )
-    await asyncio.sleep(interval)
+    await wait_for_leg(2)
     # 7: Print the current positions
     positions = await hbot_client.trading.get_positions()
     logging.info(f"Current positions: {positions}")
@@ -64,7 +69,7 @@ async def open_and_close_a_position(hbot_client: HummingbotAPIClient, interval:
         amount=amount_in_era,
         position_action="CLOSE",
     )
-    await asyncio.sleep(interval)
+    await wait_for_leg(3)
     # 9: Close the short position
     await hbot_client.trading.place_order(
         account_name="master_account",
@@ -86,4 +91,10 @@ async def main():
 
 if __name__ == '__main__':
     import asyncio
-    asyncio.run(main())
\ No newline at end of file
+
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
\ No newline at end of file
@@ -195,4 +195,10 @@ async def main():
 
 if __name__ == '__main__':
     import asyncio
-    asyncio.run(main())
\ No newline at end of file
+
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
\ No newline at end of file
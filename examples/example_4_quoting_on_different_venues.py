@@ -1,7 +1,7 @@
 from telegram import Bot
 import logging
 
-from hummingbot_api_client import HummingbotAPIClient
+from hummingbot_api_client import HummingbotAPIClient, get_default_client, close_default_client
 
 # Configure logging
 
@@ -14,24 +14,45 @@ logging.basicConfig(
 )
 
 
-async def quoting_on_multiple_exchanges(hbot_client: HummingbotAPIClient, bot: Bot, chat_id: str, interval: int):
+async def quoting_on_multiple_exchanges(hbot_client: HummingbotAPIClient, bot: Bot, chat_id: str, interval: int,
+                                        max_concurrent_quotes: int = 4, quote_timeout: float = 3.0):
+    # Cap in-flight quote requests so adding venues does not trip rate limits
+    semaphore = asyncio.Semaphore(max_concurrent_quotes)
+
+    async def get_quote(connector: str, trading_pair: str, quote_volume: float):
+        async with semaphore:
+            # Bound each venue's latency so a hung request cannot stall the whole tick
+            return await asyncio.wait_for(
+                hbot_client.market_data.get_price_for_quote_volume(
+                    connector_name=connector, trading_pair=trading_pair, quote_volume=quote_volume, is_buy=True),
+                timeout=quote_timeout)
+
     while True:
         try:
             connectors_to_quote = ["binance", "okx", "bybit", "mexc"]
             trading_pair = "WLD-USDT"
             quote_volume = 200000.0
-            tasks = [hbot_client.market_data.get_price_for_quote_volume(
-                connector_name=connector, trading_pair=trading_pair, quote_volume=quote_volume, is_buy=True) for connector in connectors_to_quote]
-            prices = await asyncio.gather(*tasks)
-            message = f"📈 *Quoting on Multiple Exchanges*\n\n"
+            tasks = [get_quote(connector, trading_pair, quote_volume) for connector in connectors_to_quote]
+            # A failing venue should not discard the quotes from the others
+            prices = await asyncio.gather(*tasks, return_exceptions=True)
+            parts = ["📈 *Quoting on Multiple Exchanges*\n\n"]
             for connector, price in zip(connectors_to_quote, prices):
+                if isinstance(price, asyncio.TimeoutError):
+                    logging.error(f"Timed out quoting on {connector} after {quote_timeout}s")
+                    price = None
+                elif isinstance(price, Exception):
+                    logging.error(f"Error quoting on {connector}: {price}")
+                    price = None
                 if price is not None:
-                    message += f"🔗 Connector: *{connector}*\n"
-                    message += f"💰 Quote Volume: `${quote_volume}`\n"
-                    message += f"💵 Price: `${price['result_price']:.4f}`\n\n"
+                    parts.append(
+                        f"🔗 Connector: *{connector}*\n"
+                        f"💰 Quote Volume: `${quote_volume}`\n"
+                        f"💵 Price: `${price['result_price']:.4f}`\n\n"
+                    )
                 else:
-                    message += f"🔗 Connector: *{connector}* - No price data available\n\n"
+                    parts.append(f"🔗 Connector: *{connector}* - No price data available\n\n")
 
+            message = "".join(parts)
             await bot.send_message(chat_id=chat_id, text=message)
             logging.info("message sent successfully")
         except Exception as e:
@@ -49,10 +70,18 @@ async def main():
 
     # Create the bot and send the message
     bot = Bot(token=BOT_TOKEN)
-    hbot_client = HummingbotAPIClient()
-    await hbot_client.init()
-    await quoting_on_multiple_exchanges(hbot_client, bot, CHAT_ID, interval=5)
+    hbot_client = await get_default_client()
+    try:
+        await quoting_on_multiple_exchanges(hbot_client, bot, CHAT_ID, interval=5)
+    finally:
+        await close_default_client()
 
 if __name__ == '__main__':
     import asyncio
-    asyncio.run(main())
\ No newline at end of file
+
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
\ No newline at end of file
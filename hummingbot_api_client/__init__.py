@@ -1,6 +1,6 @@
-from .client import HummingbotAPIClient
+from .client import HummingbotAPIClient, get_default_client, close_default_client
 from .sync_client import SyncHummingbotAPIClient
 from .ws import MarketDataWebSocket, ExecutorsWebSocket, WebSocketRouter
 
 __version__ = "1.5.1"
-__all__ = ["HummingbotAPIClient", "SyncHummingbotAPIClient", "MarketDataWebSocket", "ExecutorsWebSocket", "WebSocketRouter"]
\ No newline at end of file
+__all__ = ["HummingbotAPIClient", "get_default_client", "close_default_client", "SyncHummingbotAPIClient", "MarketDataWebSocket", "ExecutorsWebSocket", "WebSocketRouter"]
\ No newline at end of file
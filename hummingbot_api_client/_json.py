@@ -0,0 +1,71 @@
+"""JSON helpers that use orjson when it is installed and fall back to the standard library."""
+import json
+import math
+import re
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+# A run of 20+ digits that is not part of a fraction or exponent may be an integer wider than
+# 64 bits (e.g. raw on-chain amounts), which orjson decodes as a lossy float instead of an int
+_WIDE_INT_PATTERN = r"(?<![\d.])\d{20,}(?![\d.eE])"
+_WIDE_INT = re.compile(_WIDE_INT_PATTERN)
+_WIDE_INT_BYTES = re.compile(_WIDE_INT_PATTERN.encode())
+
+
+def _may_contain_wide_int(data: Any) -> bool:
+    """Return True if the document may contain an integer orjson cannot decode exactly."""
+    pattern = _WIDE_INT if isinstance(data, str) else _WIDE_INT_BYTES
+    return pattern.search(data) is not None
+
+
+def json_loads(data: Any) -> Any:
+    """Decode a JSON document, preferring orjson for speed."""
+    if orjson is not None and not _may_contain_wide_int(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the standard library (e.g. it rejects
+            # NaN/Infinity literals), so defer to it before failing
+            pass
+    return json.loads(data)
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """Return True if the object contains a NaN or infinite float anywhere."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(key) or _has_non_finite(value) for key, value in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(item) for item in obj)
+    return False
+
+
+def json_dumps(obj: Any) -> str:
+    """
+    Encode an object as a JSON string, preferring orjson for speed.
+    
+    datetime and dataclass values are passed through to the standard library so they raise
+    TypeError with or without orjson. orjson has no such option for UUID and plain Enum
+    values (or date, UUID and Enum dict keys), which it encodes where json.dumps raises.
+    """
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(
+                obj,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+            )
+        except TypeError:
+            # Covers passed-through types and values orjson cannot encode (e.g. integers wider than 64 bits)
+            pass
+        else:
+            # orjson writes NaN/Infinity as null, which the server would read as a missing
+            # value; only scan for them when the output contains a null at all
+            if b"null" not in encoded or not _has_non_finite(obj):
+                return encoded.decode()
+    return json.dumps(obj)
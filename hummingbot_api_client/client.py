@@ -1,4 +1,5 @@
-from typing import Optional
+import asyncio
+from typing import Optional, Dict, Any
 import aiohttp
 from .routers import (
     AccountsRouter,
@@ -19,6 +20,7 @@ from .routers import (
     TradingRouter
 )
 from .ws import WebSocketRouter
+from ._json import json_dumps
 
 
 class HummingbotAPIClient:
@@ -27,12 +29,37 @@ class HummingbotAPIClient:
         base_url: str = "http://localhost:8000",
         username: str = "admin",
         password: str = "admin",
-        timeout: Optional[aiohttp.ClientTimeout] = None
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+        keepalive_timeout: float = 60.0,
+        max_connections: int = 100,
+        max_connections_per_host: int = 0,
+        connector: Optional[aiohttp.BaseConnector] = None
     ):
+        """Initialize the client with connection parameters.
+        
+        Args:
+            base_url: The base URL of the Hummingbot API
+            username: The username for authentication
+            password: The password for authentication
+            timeout: Optional aiohttp timeout (defaults to 300 seconds total)
+            keepalive_timeout: Seconds an idle pooled connection is kept open
+            max_connections: Maximum number of pooled connections
+            max_connections_per_host: Maximum pooled connections per host (0 means no limit)
+            connector: Optional externally owned connector to share a connection pool between
+                clients. When given, keepalive_timeout, max_connections and
+                max_connections_per_host are ignored; configure them on the connector instead.
+        """
         self.base_url = base_url.rstrip('/')
         self.auth = aiohttp.BasicAuth(username, password)
         # Increase default timeout for operations like historical candles
         self.timeout = timeout or aiohttp.ClientTimeout(total=300)  # 5 minutes
+        # Keep idle connections open long enough to be reused by polling loops
+        self.keepalive_timeout = keepalive_timeout
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        # An externally owned connector lets several clients share one connection pool;
+        # it is left open on close() and must be closed by its owner
+        self._connector = connector
         self._session: Optional[aiohttp.ClientSession] = None
         self._accounts: Optional[AccountsRouter] = None
         self._archived_bots: Optional[ArchivedBotsRouter] = None
@@ -57,9 +84,25 @@ class HummingbotAPIClient:
     async def init(self) -> None:
         """Initialize the client session and routers."""
         if self._session is None:
+            connector = self._connector
+            if connector is None:
+                # The API host never changes for a client, so cache its DNS resolution for longer
+                # than aiohttp's 10s default to avoid re-resolving on every new pooled connection
+                connector = aiohttp.TCPConnector(
+                    limit=self.max_connections,
+                    limit_per_host=self.max_connections_per_host,
+                    keepalive_timeout=self.keepalive_timeout,
+                    ttl_dns_cache=300
+                )
             self._session = aiohttp.ClientSession(
+                connector=connector,
+                connector_owner=self._connector is None,
                 auth=self.auth,
-                timeout=self.timeout
+                timeout=self.timeout,
+                json_serialize=json_dumps,
+                # Large payloads (historical candles, trading rules) are read in fewer
+                # pause/resume cycles than with aiohttp's 64 KiB default
+                read_bufsize=2 ** 20
             )
             self._accounts = AccountsRouter(self._session, self.base_url)
             self._archived_bots = ArchivedBotsRouter(self._session, self.base_url)
@@ -83,24 +126,28 @@ class HummingbotAPIClient:
         """Close the client session."""
         if self._session:
             await self._session.close()
-            self._session = None
-            self._accounts = None
-            self._archived_bots = None
-            self._backtesting = None
-            self._bot_orchestration = None
-            self._connectors = None
-            self._controllers = None
-            self._docker = None
-            self._executors = None
-            self._gateway = None
-            self._gateway_swap = None
-            self._gateway_clmm = None
-            self._market_data = None
-            self._portfolio = None
-            self._rate_oracle = None
-            self._scripts = None
-            self._trading = None
-            self._ws = None
+            self._release()
+    
+    def _release(self) -> None:
+        """Drop the session and routers without closing the session."""
+        self._session = None
+        self._accounts = None
+        self._archived_bots = None
+        self._backtesting = None
+        self._bot_orchestration = None
+        self._connectors = None
+        self._controllers = None
+        self._docker = None
+        self._executors = None
+        self._gateway = None
+        self._gateway_swap = None
+        self._gateway_clmm = None
+        self._market_data = None
+        self._portfolio = None
+        self._rate_oracle = None
+        self._scripts = None
+        self._trading = None
+        self._ws = None
     
     @property
     def accounts(self) -> AccountsRouter:
@@ -228,4 +275,82 @@ class HummingbotAPIClient:
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        await self.close()
\ No newline at end of file
+        await self.close()
+
+
+_DEFAULT_CLIENT: Optional[HummingbotAPIClient] = None
+_DEFAULT_CLIENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_DEFAULT_CLIENT_KWARGS: Optional[Dict[str, Any]] = None
+_DEFAULT_CLIENT_LOCK: Optional[asyncio.Lock] = None
+_DEFAULT_CLIENT_LOCK_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_default_client_lock(loop: asyncio.AbstractEventLoop) -> asyncio.Lock:
+    """Return the lock guarding the default client, bound to the running event loop."""
+    global _DEFAULT_CLIENT_LOCK, _DEFAULT_CLIENT_LOCK_LOOP
+    # A lock created under a previous event loop cannot be used from another one
+    if _DEFAULT_CLIENT_LOCK is None or _DEFAULT_CLIENT_LOCK_LOOP is not loop:
+        _DEFAULT_CLIENT_LOCK = asyncio.Lock()
+        _DEFAULT_CLIENT_LOCK_LOOP = loop
+    return _DEFAULT_CLIENT_LOCK
+
+
+async def get_default_client(**kwargs) -> HummingbotAPIClient:
+    """
+    Return a shared, initialized client, creating it on first use.
+    
+    Code that calls this instead of building its own HummingbotAPIClient reuses
+    one connection pool. The keyword arguments of the first call are passed to
+    HummingbotAPIClient; later calls may omit them, but passing different ones
+    raises ValueError until close_default_client() is called. The client is
+    rebuilt with the same arguments if it has been closed or if it is requested
+    from a different event loop (e.g. a later asyncio.run). A client left over
+    from an earlier event loop is abandoned without being closed, since its
+    session can only be closed on that loop; call close_default_client() before
+    the loop ends to avoid aiohttp's unclosed session warnings.
+    
+    Example:
+        client = await get_default_client(base_url="http://localhost:8000")
+        portfolio = await client.portfolio.get_state()
+        ...
+        await close_default_client()
+    """
+    global _DEFAULT_CLIENT, _DEFAULT_CLIENT_LOOP, _DEFAULT_CLIENT_KWARGS
+    loop = asyncio.get_running_loop()
+    async with _get_default_client_lock(loop):
+        if _DEFAULT_CLIENT_KWARGS is None:
+            _DEFAULT_CLIENT_KWARGS = kwargs
+        elif kwargs and kwargs != _DEFAULT_CLIENT_KWARGS:
+            # Name only the differing arguments, their values may include credentials
+            differing = sorted(
+                key for key in kwargs.keys() | _DEFAULT_CLIENT_KWARGS.keys()
+                if kwargs.get(key) != _DEFAULT_CLIENT_KWARGS.get(key)
+            )
+            raise ValueError(
+                f"The default client was created with different values for: {', '.join(differing)}. "
+                "Call close_default_client() first or create a separate HummingbotAPIClient."
+            )
+        if _DEFAULT_CLIENT is None or _DEFAULT_CLIENT._session is None or _DEFAULT_CLIENT_LOOP is not loop:
+            if _DEFAULT_CLIENT is not None:
+                # A session bound to another (possibly closed) event loop cannot be reused or closed
+                # here; drop its references so stale holders get a clear "not initialized" error
+                _DEFAULT_CLIENT._release()
+            client = HummingbotAPIClient(**_DEFAULT_CLIENT_KWARGS)
+            await client.init()
+            _DEFAULT_CLIENT = client
+            _DEFAULT_CLIENT_LOOP = loop
+        return _DEFAULT_CLIENT
+
+
+async def close_default_client() -> None:
+    """Close the shared client returned by get_default_client() and forget its arguments."""
+    global _DEFAULT_CLIENT, _DEFAULT_CLIENT_LOOP, _DEFAULT_CLIENT_KWARGS
+    loop = asyncio.get_running_loop()
+    async with _get_default_client_lock(loop):
+        client = _DEFAULT_CLIENT
+        client_loop = _DEFAULT_CLIENT_LOOP
+        _DEFAULT_CLIENT = None
+        _DEFAULT_CLIENT_LOOP = None
+        _DEFAULT_CLIENT_KWARGS = None
+        if client is not None and client_loop is loop:
+            await client.close()
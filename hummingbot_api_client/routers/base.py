@@ -1,206 +1,76 @@
 from typing import Optional
 import aiohttp
 
+from .._json import json_loads
+
 
 class BaseRouter:
     def __init__(self, session: aiohttp.ClientSession, base_url: str):
         self.session = session
         self.base_url = base_url.rstrip('/')
-    
+
+    @staticmethod
+    async def _raise_for_error(response: aiohttp.ClientResponse) -> None:
+        """Raise a ClientResponseError carrying the server's error message if the response failed."""
+        if response.ok:
+            return
+        try:
+            error_detail = await response.json(loads=json_loads)
+            # Extract the actual error message from various possible fields
+            if isinstance(error_detail, dict):
+                if 'detail' in error_detail:
+                    error_message = error_detail['detail']
+                elif 'message' in error_detail:
+                    error_message = error_detail['message']
+                elif 'error' in error_detail:
+                    error_message = error_detail['error']
+                else:
+                    error_message = str(error_detail)
+            elif isinstance(error_detail, list) and error_detail:
+                # Handle validation errors that come as a list
+                error_message = "; ".join(str(item) for item in error_detail)
+            else:
+                error_message = str(error_detail)
+        except Exception:
+            # Fallback if we can't parse JSON - try to get text content
+            try:
+                error_text = await response.text()
+                error_message = error_text or f"HTTP {response.status}: {response.reason}"
+            except:
+                error_message = f"HTTP {response.status}: {response.reason}"
+
+        raise aiohttp.ClientResponseError(
+            response.request_info,
+            response.history,
+            status=response.status,
+            message=error_message,
+            headers=response.headers
+        )
+
     async def _get(self, path: str, params: Optional[dict] = None):
         """Perform a GET request and return JSON response."""
         url = f"{self.base_url}/{path.lstrip('/')}"
         async with self.session.get(url, params=params) as response:
-            if not response.ok:
-                try:
-                    error_detail = await response.json()
-                    # Extract the actual error message from various possible fields
-                    if isinstance(error_detail, dict):
-                        if 'detail' in error_detail:
-                            error_message = error_detail['detail']
-                        elif 'message' in error_detail:
-                            error_message = error_detail['message']
-                        elif 'error' in error_detail:
-                            error_message = error_detail['error']
-                        else:
-                            error_message = str(error_detail)
-                    elif isinstance(error_detail, list) and error_detail:
-                        # Handle validation errors that come as a list
-                        error_message = "; ".join(str(item) for item in error_detail)
-                    else:
-                        error_message = str(error_detail)
-                    
-                    raise aiohttp.ClientResponseError(
-                        response.request_info, 
-                        response.history,
-                        status=response.status,
-                        message=error_message,
-                        headers=response.headers
-                    )
-                except aiohttp.ClientResponseError:
-                    # Re-raise our custom error
-                    raise
-                except Exception:
-                    # Fallback if we can't parse JSON
-                    try:
-                        error_text = await response.text()
-                        error_message = error_text or f"HTTP {response.status}: {response.reason}"
-                    except:
-                        error_message = f"HTTP {response.status}: {response.reason}"
-                    
-                    raise aiohttp.ClientResponseError(
-                        response.request_info,
-                        response.history,
-                        status=response.status,
-                        message=error_message,
-                        headers=response.headers
-                    )
-            return await response.json()
-    
+            await self._raise_for_error(response)
+            return await response.json(loads=json_loads)
+
     async def _post(self, path: str, json: Optional[dict] = None, params: Optional[dict] = None) -> dict:
         """Perform a POST request and return JSON response."""
         url = f"{self.base_url}/{path.lstrip('/')}"
         async with self.session.post(url, json=json, params=params) as response:
-            if not response.ok:
-                try:
-                    error_detail = await response.json()
-                    # Extract the actual error message from various possible fields
-                    if isinstance(error_detail, dict):
-                        if 'detail' in error_detail:
-                            error_message = error_detail['detail']
-                        elif 'message' in error_detail:
-                            error_message = error_detail['message']
-                        elif 'error' in error_detail:
-                            error_message = error_detail['error']
-                        else:
-                            error_message = str(error_detail)
-                    elif isinstance(error_detail, list) and error_detail:
-                        # Handle validation errors that come as a list
-                        error_message = "; ".join(str(item) for item in error_detail)
-                    else:
-                        error_message = str(error_detail)
-                    
-                    raise aiohttp.ClientResponseError(
-                        response.request_info, 
-                        response.history,
-                        status=response.status,
-                        message=error_message,
-                        headers=response.headers
-                    )
-                except aiohttp.ClientResponseError:
-                    # Re-raise our custom error
-                    raise
-                except Exception:
-                    # Fallback if we can't parse JSON - try to get text content
-                    try:
-                        error_text = await response.text()
-                        error_message = error_text or f"HTTP {response.status}: {response.reason}"
-                    except:
-                        error_message = f"HTTP {response.status}: {response.reason}"
-                    
-                    raise aiohttp.ClientResponseError(
-                        response.request_info,
-                        response.history,
-                        status=response.status,
-                        message=error_message,
-                        headers=response.headers
-                    )
-            response.raise_for_status()
-            return await response.json()
-    
+            await self._raise_for_error(response)
+            return await response.json(loads=json_loads)
+
     async def _put(self, path: str, json: Optional[dict] = None, params: Optional[dict] = None) -> dict:
         """Perform a PUT request and return JSON response."""
         url = f"{self.base_url}/{path.lstrip('/')}"
         async with self.session.put(url, json=json, params=params) as response:
-            if not response.ok:
-                try:
-                    error_detail = await response.json()
-                    if isinstance(error_detail, dict):
-                        if 'detail' in error_detail:
-                            error_message = error_detail['detail']
-                        elif 'message' in error_detail:
-                            error_message = error_detail['message']
-                        elif 'error' in error_detail:
-                            error_message = error_detail['error']
-                        else:
-                            error_message = str(error_detail)
-                    elif isinstance(error_detail, list) and error_detail:
-                        error_message = "; ".join(str(item) for item in error_detail)
-                    else:
-                        error_message = str(error_detail)
-
-                    raise aiohttp.ClientResponseError(
-                        response.request_info,
-                        response.history,
-                        status=response.status,
-                        message=error_message,
-                        headers=response.headers
-                    )
-                except aiohttp.ClientResponseError:
-                    raise
-                except Exception:
-                    try:
-                        error_text = await response.text()
-                        error_message = error_text or f"HTTP {response.status}: {response.reason}"
-                    except:
-                        error_message = f"HTTP {response.status}: {response.reason}"
-
-                    raise aiohttp.ClientResponseError(
-                        response.request_info,
-                        response.history,
-                        status=response.status,
-                        message=error_message,
-                        headers=response.headers
-                    )
-            response.raise_for_status()
-            return await response.json()
+            await self._raise_for_error(response)
+            return await response.json(loads=json_loads)
 
     async def _delete(self, path: str, params: Optional[dict] = None) -> dict:
         """Perform a DELETE request and return JSON response."""
         url = f"{self.base_url}/{path.lstrip('/')}"
         async with self.session.delete(url, params=params) as response:
-            if not response.ok:
-                try:
-                    error_detail = await response.json()
-                    # Extract the actual error message from various possible fields
-                    if isinstance(error_detail, dict):
-                        if 'detail' in error_detail:
-                            error_message = error_detail['detail']
-                        elif 'message' in error_detail:
-                            error_message = error_detail['message']
-                        elif 'error' in error_detail:
-                            error_message = error_detail['error']
-                        else:
-                            error_message = str(error_detail)
-                    elif isinstance(error_detail, list) and error_detail:
-                        # Handle validation errors that come as a list
-                        error_message = "; ".join(str(item) for item in error_detail)
-                    else:
-                        error_message = str(error_detail)
-                    
-                    raise aiohttp.ClientResponseError(
-                        response.request_info, 
-                        response.history,
-                        status=response.status,
-                        message=error_message,
-                        headers=response.headers
-                    )
-                except aiohttp.ClientResponseError:
-                    # Re-raise our custom error
-                    raise
-                except Exception:
-                    # Fallback if we can't parse JSON
-                    try:
-                        error_text = await response.text()
-                        error_message = error_text or f"HTTP {response.status}: {response.reason}"
-                    except:
-                        error_message = f"HTTP {response.status}: {response.reason}"
-                    
-                    raise aiohttp.ClientResponseError(
-                        response.request_info,
-                        response.history,
-                        status=response.status,
-                        message=error_message,
-                        headers=response.headers
-                    )
-            return await response.json()
\ No newline at end of file
+            await self._raise_for_error(response)
+            return await response.json(loads=json_loads)
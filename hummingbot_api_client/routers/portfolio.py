@@ -1,4 +1,6 @@
-from typing import Optional, Dict, Any, List, Union
+import asyncio
+import heapq
+from typing import Optional, Dict, Any, List, Union, AsyncIterator
 from .base import BaseRouter
 
 
@@ -107,6 +109,69 @@ class PortfolioRouter(BaseRouter):
             
         return await self._post("/portfolio/history", json=filter_request)
     
+    async def iter_history(
+        self,
+        account_names: Optional[List[str]] = None,
+        connector_names: Optional[List[str]] = None,
+        batch_size: int = 500,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        interval: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over all historical portfolio states, following pagination automatically.
+        
+        The next page is requested as soon as the current one arrives, so it is
+        already in flight while the caller processes the entries of the current page.
+        Only available on the async client; sync callers should page with get_history.
+        
+        Args:
+            account_names: List of accounts to filter by (default: all accounts)
+            connector_names: List of connectors to filter by (default: all connectors)
+            batch_size: Number of history entries requested per page (default: 500)
+            start_time: Start timestamp (Unix timestamp in seconds)
+            end_time: End timestamp (Unix timestamp in seconds)
+            interval: Data sampling interval: 5m, 15m, 30m, 1h, 4h, 12h, 1d. Default is 5m (raw data)
+        Yields:
+            Individual historical portfolio entries
+            
+        Example:
+            # Walk the full portfolio history of the last 30 days
+            import time
+            month_ago = int(time.time()) - (30 * 24 * 60 * 60)
+            async for entry in client.portfolio.iter_history(start_time=month_ago):
+                print(entry)
+        """
+        def fetch_page(cursor: Optional[str]) -> "asyncio.Task":
+            return asyncio.ensure_future(self.get_history(
+                account_names=account_names,
+                connector_names=connector_names,
+                limit=batch_size,
+                cursor=cursor,
+                start_time=start_time,
+                end_time=end_time,
+                interval=interval,
+            ))
+        
+        next_page = fetch_page(None)
+        try:
+            while next_page is not None:
+                response = await next_page
+                next_page = None
+                pagination = response.get("pagination", {})
+                if pagination.get("has_more") and pagination.get("next_cursor"):
+                    next_page = fetch_page(pagination["next_cursor"])
+                for entry in response.get("data", []):
+                    yield entry
+        finally:
+            # Don't leave the prefetch running if the caller stops iterating early
+            if next_page is not None:
+                if not next_page.done():
+                    next_page.cancel()
+                elif not next_page.cancelled():
+                    # Retrieve a failed prefetch's error so asyncio doesn't log it as never retrieved
+                    next_page.exception()
+    
     async def get_distribution(
         self,
         account_names: Optional[List[str]] = None,
@@ -217,6 +282,7 @@ class PortfolioRouter(BaseRouter):
         
         state = await self.get_state(account_names, connector_names)
         
+        token_upper = token.upper()
         holdings = {
             "token": token,
             "total_units": 0.0,
@@ -228,7 +294,7 @@ class PortfolioRouter(BaseRouter):
         for account_name, account_data in state.items():
             for connector_name, connector_balances in account_data.items():
                 for balance in connector_balances:
-                    if balance.get("token", "").upper() == token.upper():
+                    if balance.get("token", "").upper() == token_upper:
                         units = balance.get("units", 0)
                         value = balance.get("value", 0)
                         price = balance.get("price", 0)
@@ -272,28 +338,33 @@ class PortfolioRouter(BaseRouter):
         """
         account_names = [account_name] if account_name else None
         
-        # Get portfolio state and distribution
-        state = await self.get_state(account_names)
-        distribution = await self.get_distribution(account_names)
-        
-        # Calculate summary metrics
-        total_value = await self.get_total_value(account_name)
+        # Get portfolio state and distribution concurrently, they are independent requests
+        state, distribution = await asyncio.gather(
+            self.get_state(account_names),
+            self.get_distribution(account_names)
+        )
         
-        # Count accounts and connectors
+        # Calculate summary metrics from the state already fetched instead of requesting it again,
+        # counting connectors and summing values in a single pass
         account_count = len(state)
-        connector_count = sum(len(account_data) for account_data in state.values())
+        connector_count = 0
+        total_value = 0.0
+        for account_data in state.values():
+            connector_count += len(account_data)
+            for connector_balances in account_data.values():
+                for balance in connector_balances:
+                    total_value += balance.get("value", 0)
         
         # Get token count and top tokens
         tokens = distribution.get("tokens", {})
         token_count = len(tokens)
         
-        # Sort tokens by value and get top 5
-        sorted_tokens = sorted(
+        # Get top 5 tokens by value without sorting the whole distribution
+        top_tokens = heapq.nlargest(
+            5,
             tokens.items(),
-            key=lambda x: x[1].get("value", 0),
-            reverse=True
+            key=lambda x: x[1].get("value", 0)
         )
-        top_tokens = sorted_tokens[:5]
         
         return {
             "total_value": total_value,
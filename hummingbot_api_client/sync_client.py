@@ -1,5 +1,6 @@
 """Synchronous wrapper for HummingbotAPIClient."""
 import asyncio
+import inspect
 from functools import wraps
 from typing import Any, Callable, TypeVar, Optional, TYPE_CHECKING
 
@@ -185,6 +186,12 @@ class SyncRouterWrapper:
         """Dynamically wrap async methods to be synchronous."""
         attr = getattr(self._async_router, name)
 
+        if inspect.isasyncgenfunction(attr):
+            # Async generators (e.g. portfolio.iter_history) can't be driven one item at a time from sync code
+            raise AttributeError(
+                f"{type(self._async_router).__name__}.{name} is only available on the async HummingbotAPIClient"
+            )
+
         if asyncio.iscoroutinefunction(attr):
             def sync_method(*args, **kwargs):
                 if self._created_loop:
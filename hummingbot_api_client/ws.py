@@ -5,6 +5,8 @@ from typing import Optional, Dict, Any, List, TypeVar, AsyncIterator, Callable,
 
 import aiohttp
 
+from ._json import json_dumps, json_loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,12 +26,12 @@ class _BaseWebSocket:
         return self._ws.closed
 
     async def _send(self, msg: dict) -> None:
-        await self._ws.send_json(msg)
+        await self._ws.send_json(msg, dumps=json_dumps)
 
     async def _receive(self) -> Dict[str, Any]:
         ws_msg = await self._ws.receive()
         if ws_msg.type == aiohttp.WSMsgType.TEXT:
-            return ws_msg.json()
+            return ws_msg.json(loads=json_loads)
         elif ws_msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.CLOSING):
             raise ConnectionError("WebSocket connection closed")
         elif ws_msg.type == aiohttp.WSMsgType.ERROR: